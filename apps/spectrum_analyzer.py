@@ -1,13 +1,43 @@
+import os
+import queue
 import signal
+import pickle
 import argparse
+import threading
 import numpy as np
-from collections import deque
 from pysdr.rtlsdr import Radio
+from pysdr.kernels import post_fft
 import matplotlib.pyplot as plt
+
+# Animation throughput is backend bound for dense updates. Prefer the
+# Qt5Agg blit path and allow overriding via PYSDR_BACKEND (e.g.
+# PYSDR_BACKEND=module://gr.matplotlib.backend_gr for the GR backend).
+# Falls back to the default backend when the requested one is not
+# installed.
+try:
+    plt.switch_backend(os.environ.get('PYSDR_BACKEND', 'Qt5Agg'))
+except ImportError:
+    pass
+
 plt.style.use(['fast'])
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
 from pysdr.utils import print_info_msg
-from pysdr.rtlsdr_apis import librtlsdr
-import matplotlib.animation as animation
+from pysdr.rtlsdr_apis import get_librtlsdr
+
+# pyFFTW is optional. When installed the per frame FFT runs through a
+# multi-threaded FFTW plan built once at startup, otherwise the app
+# falls back to numpy.fft.
+try:
+    import pyfftw
+    pyfftw.interfaces.cache.enable()
+except ImportError:
+    pyfftw = None
+
+fft_plan = None
+fft_in_buf = None
+fft_out_buf = None
+fftw_wisdom_file = os.path.join(os.path.expanduser("~"), ".cache", "pysdr_wisdom")
 
 parser = argparse.ArgumentParser(description="Spectrum analyzer tool for pysdr.")
 parser.add_argument("-f", "--center-freq", type=int, default=980e6, help="Center frequency in Hz. Default: 980 MHz.")
@@ -22,14 +52,79 @@ parser.add_argument("-d", "--device-index", required=True, type=int, help="Devic
 parser.add_argument("-l", "--logging-level", default=3, type=int, help="Logging level, (1-4). Default: 3")
 parser.add_argument("-p", "--ppm", type=int, default=0, help="Freq offset correction value in ppm. Default: 0 ppm. (No correction).")
 parser.add_argument("-mp", "--plot-mag-pha", type=int, default=0, help="Enable plot of mag and phase of the signal. Default: 0. Disabled.")
+parser.add_argument("-b", "--bins", type=int, default=2048, help="Maximum number of PSD points to draw. The PSD is bucket-averaged down to this many points when -n is larger. Default: 2048.")
 
 args = parser.parse_args()
 
 max_frames = 300
-frame_count = 0
-waterfall_queue = deque(maxlen=max_frames)
-for idx in range(max_frames):
-    waterfall_queue.append(np.zeros(args.samples))
+frame_idx = 0
+# Preallocated ring buffer for the waterfall. The buffer is doubled
+# along the time axis so that the latest max_frames rows can always
+# be sliced out as a contiguous view without copying or rolling.
+waterfall_buf = np.zeros((2*max_frames, args.samples), dtype=np.float32)
+
+# Line draw cost grows with the number of plotted points, so the PSD
+# is bucket-averaged down to at most args.bins points before drawing.
+# The bucket edges and counts are computed once.
+plot_bins = min(args.bins, args.samples)
+psd_edges = np.linspace(0, args.samples, plot_bins+1, dtype=np.int64)
+psd_counts = np.diff(psd_edges).astype(np.float32)
+psd_edges = psd_edges[:-1]
+
+# Preallocated scratch buffer for the full-resolution PSD and two
+# output buffer sets (mag, pha, downsampled psd). The compute worker
+# takes an idle set from the free list, fills it and hands it to the
+# GUI thread through the frame queue; the GUI returns the set to the
+# free list only after it has been blitted, so a set is never
+# overwritten while it is being drawn.
+signal_psd_db = np.empty(args.samples, dtype=np.float32)
+frame_bufs = [(np.empty(args.samples, dtype=np.float32),
+               np.empty(args.samples, dtype=np.float32),
+               np.empty(plot_bins, dtype=np.float32)) for _ in range(2)]
+frame_queue = queue.Queue(maxsize=1)
+free_bufs = queue.Queue()
+for bufs in frame_bufs:
+    free_bufs.put(bufs)
+
+def compute_frames(sdr):
+    """
+    Compute worker loop. Reads samples from the SDR, runs
+    the FFT and the fused post-FFT kernel and pushes the
+    finished frame buffers into the frame queue for the
+    GUI thread to draw. Runs on a daemon thread so the
+    FFT and post-processing overlap with the matplotlib
+    draw of the previous frame.
+
+    Parameters
+    ----------
+    * sdr                          : (pysdr.rtlsdr.Radio) The SDR Radio object.
+    """
+    while True:
+        samples = sdr.rx_samples()
+        if fft_plan is not None:
+            fft_in_buf[:] = samples
+            fft_plan()
+            signal_fft = fft_out_buf
+        else:
+            signal_fft = np.fft.fft(samples)
+        #signal_fft = signal_fft * np.hamming(signal_fft.size)
+        # Blocks until the GUI thread has returned an idle buffer
+        # set, so the set drawn last tick is never overwritten here.
+        frame = free_bufs.get()
+        signal_mag, signal_pha, psd_plot_buf = frame
+        # Single fused pass over the FFT output. The kernel performs the
+        # FFT-shift and fills the preallocated mag/pha/psd buffers.
+        # The phase pass is skipped unless the mag/phase plots were
+        # requested with -mp 1. The magnitude is always needed for
+        # the waterfall.
+        post_fft(signal_fft, sdr.sample_rate, signal_mag, signal_pha, signal_psd_db,
+                 args.plot_mag_pha == 1)
+        if plot_bins < args.samples:
+            np.add.reduceat(signal_psd_db, psd_edges, out=psd_plot_buf)
+            psd_plot_buf /= psd_counts
+        else:
+            psd_plot_buf[:] = signal_psd_db
+        frame_queue.put(frame)
 
 def plot_samples(i, sdr, axes):
     """
@@ -41,52 +136,51 @@ def plot_samples(i, sdr, axes):
     * i                            : (int) For matplotlib internal use.
     * sdr                          : (pysdr.rtlsdr.Radio) The SDR Radio object.
     * axes                         : (matplotlib.subplots) Axis to plot graphs.
+
+    Returns
+    -------
+    * changed_artists              : (list) Artists whose data changed this tick.
+    * frame                        : (tuple) The consumed buffer set, to be
+                                        returned to the free list after the
+                                        blit, or None when no frame was ready.
     """
-    
-    # Plot FFT
-    num_sample_pts = sdr.num_recv_samples
-    samples = sdr.rx_samples()
-    signal_fft = np.fft.fftshift(np.fft.fft(samples))
-    #signal_fft = signal_fft * np.hamming(signal_fft.size)
-    signal_mag = np.abs(signal_fft)
-    signal_pha = np.angle(signal_fft)
-    signal_psd = np.abs(signal_fft/sdr.sample_rate)**2
-    signal_psd_db = 10.0 * np.log10(signal_psd)
-
-    fft_resolution = int(sdr.sample_rate/num_sample_pts)
-    low_freq = sdr.center_freq - sdr.sample_rate/2
-    high_freq = sdr.center_freq + sdr.sample_rate/2
-    freq = np.arange(low_freq, high_freq, fft_resolution)[0:num_sample_pts]
-    
-    waterfall_queue.append(signal_mag)
-    axis_dict['wfall-axis']['axis'].clear()
-    axis_dict['wfall-axis']['axis'].imshow(waterfall_queue, cmap='YlOrBr', interpolation='bicubic', aspect='auto')
-    axis_dict['wfall-axis']['axis'].xaxis.set_ticklabels([])
-    axis_dict['wfall-axis']['axis'].set_ylabel("Time")
-    
-    if args.plot_mag_pha == 1:
-        axis_dict['mag-axis']['axis'].clear()
-        axis_dict['mag-axis']['axis'].set_ylabel("Magnitude")
-        axis_dict['mag-axis']['axis'].plot(freq/1e6, signal_mag, linewidth=0.5)
-        axis_dict['mag-axis']['axis'].set_ylim([-5, 350])
-        axis_dict['mag-axis']['axis'].grid()
+
+    # The math already happened on the compute thread; this callback
+    # only pushes the finished buffers into the artists.
+    try:
+        frame = frame_queue.get_nowait()
+    except queue.Empty:
+        return [], None
+    signal_mag, signal_pha, psd_plot_buf = frame
+
+    # Write the new row at both halves of the doubled buffer and
+    # slice out a zero-copy window holding the last max_frames rows.
+    global frame_idx
+    write_idx = frame_idx % max_frames
+    waterfall_buf[write_idx] = signal_mag
+    waterfall_buf[write_idx + max_frames] = waterfall_buf[write_idx]
+    frame_idx += 1
+    waterfall_window = waterfall_buf[write_idx+1:write_idx+1+max_frames]
+    wfall_im = axis_dict['wfall-axis']['artist']
+    wfall_im.set_data(waterfall_window)
+    wfall_im.set_clim(waterfall_window.min(), waterfall_window.max())
+    changed_artists = [wfall_im]
 
     if args.plot_mag_pha == 1:
-        axis_dict['pha-axis']['axis'].clear()
-        axis_dict['pha-axis']['axis'].set_ylabel("Phase")
-        axis_dict['pha-axis']['axis'].plot(freq/1e6, signal_pha, linewidth=0.5)
-        axis_dict['pha-axis']['axis'].set_ylim([-7, 7])
-        axis_dict['pha-axis']['axis'].grid()
-        
-    axis_dict['psd-axis']['axis'].clear()
-    axis_dict['psd-axis']['axis'].set_xlabel("Frequency (MHz)")
-    axis_dict['psd-axis']['axis'].set_ylabel("PSD (dB)")
-    axis_dict['psd-axis']['axis'].plot(freq/1e6, signal_psd_db, linewidth=0.5)
-    axis_dict['psd-axis']['axis'].set_ylim([-135, -20])
-    axis_dict['psd-axis']['axis'].grid()
-    
-    
-   
+        mag_line = axis_dict['mag-axis']['artist']
+        mag_line.set_ydata(signal_mag)
+        changed_artists.append(mag_line)
+
+        pha_line = axis_dict['pha-axis']['artist']
+        pha_line.set_ydata(signal_pha)
+        changed_artists.append(pha_line)
+
+    psd_line = axis_dict['psd-axis']['artist']
+    psd_line.set_ydata(psd_plot_buf)
+    changed_artists.append(psd_line)
+    return changed_artists, frame
+
+
 def signal_handler(sdr):
     """
     Used to handle SIGINT.
@@ -98,7 +192,7 @@ def signal_handler(sdr):
 if __name__ == "__main__":
 
     # Create an object of the librtlsdr
-    lrtlsdr = librtlsdr()
+    lrtlsdr = get_librtlsdr()
     
     if args.query_device == 1:
         attached_devices = lrtlsdr.py_rtlsdr_get_device_count()
@@ -106,7 +200,10 @@ if __name__ == "__main__":
         exit(0)
 
     sdr = Radio(device_index=args.device_index, logging_level=args.logging_level)
-    
+
+    # Close the device cleanly on Ctrl-C.
+    signal.signal(signal.SIGINT, lambda *sig_args: signal_handler(sdr))
+
     # Check if querying for supported lna gain values.
     if args.query_gains == 1:
         print_info_msg("Supported Tuner/LNA gain values in dB: %s"%(sdr.tuner_gains))
@@ -131,6 +228,26 @@ if __name__ == "__main__":
     # Print device settings
     sdr.print_device_configuration()
 
+    # Build the FFTW plan once with persistent aligned buffers.
+    # Saved wisdom amortizes the FFTW_MEASURE planning cost
+    # across runs.
+    if pyfftw is not None:
+        try:
+            with open(fftw_wisdom_file, 'rb') as wisdom_file:
+                pyfftw.import_wisdom(pickle.load(wisdom_file))
+        except (OSError, pickle.PickleError):
+            pass
+        fft_in_buf = pyfftw.empty_aligned(args.samples, dtype='complex64')
+        fft_out_buf = pyfftw.empty_aligned(args.samples, dtype='complex64')
+        fft_plan = pyfftw.FFTW(fft_in_buf, fft_out_buf, direction='FFTW_FORWARD',
+                               flags=('FFTW_MEASURE',), threads=max(os.cpu_count()//2, 1))
+        try:
+            os.makedirs(os.path.dirname(fftw_wisdom_file), exist_ok=True)
+            with open(fftw_wisdom_file, 'wb') as wisdom_file:
+                pickle.dump(pyfftw.export_wisdom(), wisdom_file)
+        except OSError:
+            pass
+
     # Plot axes.
     fig = plt.figure()
 
@@ -154,6 +271,101 @@ if __name__ == "__main__":
         axis_dict = {'wfall-axis': {'axis': waterfall_axis,
                                 'ylim': [float('inf'), -float('inf')] },
                     'psd-axis': {'axis': psd_axis}}
-    
-    ani = animation.FuncAnimation(fig, plot_samples, fargs=(sdr, axis_dict,), interval=10)
+
+    # Create the artists once and update only their data in the
+    # animation callback. Together with blitting this avoids the
+    # full axis re-layout which dominates the per frame draw cost.
+    num_sample_pts = sdr.num_recv_samples
+    freq = sdr.freq_axis_mhz
+
+    waterfall_axis.xaxis.set_ticklabels([])
+    waterfall_axis.set_ylabel("Time")
+    # Nearest-neighbour interpolation: the rows are noisy spectra, so
+    # bicubic upsampling of the 300xN image buys nothing visually but
+    # dominates the rasterizer cost.
+    axis_dict['wfall-axis']['artist'] = waterfall_axis.imshow(waterfall_buf[0:max_frames],
+                                                              cmap='YlOrBr', interpolation='nearest',
+                                                              aspect='auto', animated=True)
+
+    psd_axis.set_xlabel("Frequency (MHz)")
+    psd_axis.set_ylabel("PSD (dB)")
+    psd_axis.set_ylim([-135, -20])
+    psd_axis.set_xlim([freq[0], freq[-1]])
+    psd_axis.grid()
+    if plot_bins < num_sample_pts:
+        psd_freq = np.linspace(freq[0], freq[-1], plot_bins)
+    else:
+        psd_freq = freq
+    axis_dict['psd-axis']['artist'], = psd_axis.plot(psd_freq, np.full(plot_bins, -135.0),
+                                                     linewidth=0.5, animated=True)
+
+    if args.plot_mag_pha == 1:
+        mag_axis.set_ylabel("Magnitude")
+        mag_axis.set_ylim([-5, 350])
+        mag_axis.set_xlim([freq[0], freq[-1]])
+        mag_axis.grid()
+        axis_dict['mag-axis']['artist'], = mag_axis.plot(freq, np.zeros(num_sample_pts),
+                                                         linewidth=0.5, animated=True)
+
+        pha_axis.set_ylabel("Phase")
+        pha_axis.set_ylim([-7, 7])
+        pha_axis.set_xlim([freq[0], freq[-1]])
+        pha_axis.grid()
+        axis_dict['pha-axis']['artist'], = pha_axis.plot(freq, np.zeros(num_sample_pts),
+                                                         linewidth=0.5, animated=True)
+
+    # Stream samples on a background thread so USB I/O overlaps
+    # with the FFT and draw work in the animation callback.
+    sdr.start_stream()
+
+    # Compute the next frame on a worker thread while the GUI
+    # thread blits the previous one.
+    compute_thread = threading.Thread(target=compute_frames, args=(sdr,), daemon=True)
+    compute_thread.start()
+
+    # Manual blit loop driven by a backend timer. Skips the frame
+    # sequencing and artist bookkeeping FuncAnimation does per tick:
+    # each tick restores the cached axis backgrounds, redraws only
+    # the changed artists and blits their regions.
+    backgrounds = {}
+
+    def grab_backgrounds(event=None):
+        """
+        Caches the background bitmap of every animated axis.
+        Re-run on every full draw (resize, etc.).
+        """
+        for entry in axis_dict.values():
+            entry_axis = entry['axis']
+            backgrounds[entry_axis] = fig.canvas.copy_from_bbox(entry_axis.bbox)
+
+    fig.canvas.mpl_connect('draw_event', grab_backgrounds)
+
+    def update_frame():
+        """
+        Timer callback. Draws the newest computed frame with
+        manual blitting.
+        """
+        changed_artists, frame = plot_samples(0, sdr, axis_dict)
+        if frame is None:
+            return
+        # The buffer set goes back to the free list only after the
+        # blit below, so the worker cannot overwrite arrays the
+        # artists are still being rasterized from.
+        try:
+            if not changed_artists or not backgrounds:
+                return
+            changed_axes = set(artist.axes for artist in changed_artists)
+            for changed_axis in changed_axes:
+                fig.canvas.restore_region(backgrounds[changed_axis])
+            for artist in changed_artists:
+                artist.axes.draw_artist(artist)
+            for changed_axis in changed_axes:
+                fig.canvas.blit(changed_axis.bbox)
+            fig.canvas.flush_events()
+        finally:
+            free_bufs.put(frame)
+
+    timer = fig.canvas.new_timer(interval=10)
+    timer.add_callback(update_frame)
+    timer.start()
     plt.show()
\ No newline at end of file
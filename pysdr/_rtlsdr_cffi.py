@@ -0,0 +1,67 @@
+from ctypes.util import find_library
+
+"""
+cffi is optional. When installed the hot control-path
+librtlsdr calls can be routed through the cffi ABI mode,
+which has a lower per-call overhead than ctypes/libffi
+for simple primitive signatures. The ctypes path always
+remains available as the default backend.
+"""
+try:
+    import cffi
+except ImportError:
+    cffi = None
+
+"""
+C declarations mirroring the api_prototypes table in
+pysdr.rtlsdr_apis. The full API set is declared so any
+wrapper can be moved onto the cffi backend (or a generated
+C stub) by flipping its binding, although only the hot
+polled getters are rebound today.
+"""
+_CDEF = """
+typedef void (*rtlsdr_read_async_cb_t)(unsigned char *buf, uint32_t len, void *ctx);
+uint32_t rtlsdr_get_device_count(void);
+const char *rtlsdr_get_device_name(uint32_t index);
+int rtlsdr_get_device_usb_strings(uint32_t index, char *manufact, char *product, char *serial);
+int rtlsdr_get_index_by_serial(const char *serial);
+int rtlsdr_open(void **dev, uint32_t index);
+int rtlsdr_close(void *dev);
+int rtlsdr_get_xtal_freq(void *dev, uint32_t *rtl_freq, uint32_t *tuner_freq);
+int rtlsdr_set_center_freq(void *dev, uint32_t freq);
+uint32_t rtlsdr_get_center_freq(void *dev);
+int rtlsdr_set_tuner_gain(void *dev, int gain);
+int rtlsdr_get_tuner_gains(void *dev, int *gains);
+int rtlsdr_get_tuner_gain(void *dev);
+int rtlsdr_set_freq_correction(void *dev, int ppm);
+int rtlsdr_get_freq_correction(void *dev);
+int rtlsdr_set_agc_mode(void *dev, int on);
+int rtlsdr_set_sample_rate(void *dev, uint32_t rate);
+uint32_t rtlsdr_get_sample_rate(void *dev);
+int rtlsdr_set_tuner_gain_mode(void *dev, int manual);
+int rtlsdr_reset_buffer(void *dev);
+int rtlsdr_read_sync(void *dev, void *buf, int len, int *n_read);
+int rtlsdr_read_async(void *dev, rtlsdr_read_async_cb_t cb, void *ctx, uint32_t buf_num, uint32_t buf_len);
+int rtlsdr_cancel_async(void *dev);
+"""
+
+def load():
+    """
+    Loads the librtlsdr shared library through the cffi ABI
+    mode and declares the hot control-path prototypes.
+
+    Returns
+    -------
+    * ffi                           : (cffi.FFI) The FFI instance, or None when
+                                        cffi or librtlsdr is unavailable.
+    * lib                           : (cffi lib) The dlopen'ed library object, or
+                                        None when cffi or librtlsdr is unavailable.
+    """
+    if cffi is None:
+        return None, None
+    shared_lib = find_library('rtlsdr.so')
+    if shared_lib is None:
+        return None, None
+    ffi = cffi.FFI()
+    ffi.cdef(_CDEF)
+    return ffi, ffi.dlopen(shared_lib)
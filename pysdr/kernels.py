@@ -0,0 +1,124 @@
+import math
+import numpy as np
+
+"""
+Numba is optional. When installed the fused post-FFT
+kernel is JIT compiled to a single parallel SIMD pass,
+otherwise a NumPy fallback with preallocated output
+buffers is used.
+"""
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def post_fft(fft_out, sample_rate, mag, pha, psd_db, compute_pha=True):
+        """
+        Fuses the FFT-shift, magnitude, phase and PSD-dB
+        computation on the FFT output into a single pass.
+        The results are written into the preallocated
+        mag, pha and psd_db buffers. The relatively
+        expensive atan2 phase pass only runs when
+        compute_pha is True.
+
+        Parameters
+        ----------
+        * fft_out                       : (np.array) Unshifted FFT output of complex type.
+        * sample_rate                   : (int) Sample rate of the device in Hz.
+        * mag                           : (np.array) Preallocated float32 output buffer for magnitude.
+        * pha                           : (np.array) Preallocated float32 output buffer for phase.
+        * psd_db                        : (np.array) Preallocated float32 output buffer for PSD in dB.
+        * compute_pha                   : (bool) Whether to compute the phase. Default: True.
+        """
+        n = fft_out.size
+        half = n//2
+        inv_sr2 = 1.0/(sample_rate*sample_rate)
+        for i in prange(n):
+            j = (i + half) % n
+            re = fft_out[j].real
+            im = fft_out[j].imag
+            power = re*re + im*im
+            mag[i] = math.sqrt(power)
+            if compute_pha:
+                pha[i] = math.atan2(im, re)
+            psd_db[i] = 10.0*math.log10(power*inv_sr2)
+
+    @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def u8_to_cf32(raw, out):
+        """
+        Converts interleaved uint8 IQ bytes from the device
+        into normalized float32 I/Q pairs in a single
+        parallel SIMD pass. Viewing the output buffer as
+        complex64 yields the normalized samples.
+
+        Parameters
+        ----------
+        * raw                           : (np.array) Interleaved uint8 IQ bytes.
+        * out                           : (np.array) Preallocated float32 output buffer
+                                            of the same size as raw.
+        """
+        n = raw.size
+        for i in prange(n):
+            out[i] = (raw[i] - 127.5) * (1.0/127.5)
+
+else:
+
+    # Bound once at import so the fallback conversion does not
+    # rebuild the float32 scalar constants on every frame.
+    _IQ_BIAS = np.float32(127.5)
+    _IQ_SCALE = np.float32(1.0/127.5)
+
+    def post_fft(fft_out, sample_rate, mag, pha, psd_db, compute_pha=True):
+        """
+        Fuses the FFT-shift, magnitude, phase and PSD-dB
+        computation on the FFT output using in-place NumPy
+        operations. The results are written into the
+        preallocated mag, pha and psd_db buffers. The
+        relatively expensive arctan2 phase pass only runs
+        when compute_pha is True.
+
+        Parameters
+        ----------
+        * fft_out                       : (np.array) Unshifted FFT output of complex type.
+        * sample_rate                   : (int) Sample rate of the device in Hz.
+        * mag                           : (np.array) Preallocated float32 output buffer for magnitude.
+        * pha                           : (np.array) Preallocated float32 output buffer for phase.
+        * psd_db                        : (np.array) Preallocated float32 output buffer for PSD in dB.
+        * compute_pha                   : (bool) Whether to compute the phase. Default: True.
+        """
+        shifted = np.fft.fftshift(fft_out)
+        re = shifted.real
+        im = shifted.imag
+        # The power is accumulated in the mag buffer and the divide
+        # by the sample rate is folded into a constant subtraction
+        # after the log, so no temporaries are allocated.
+        np.multiply(re, re, out=mag, casting='same_kind')
+        np.multiply(im, im, out=psd_db, casting='same_kind')
+        mag += psd_db
+        with np.errstate(divide='ignore'):
+            np.log10(mag, out=psd_db)
+        psd_db *= 10.0
+        psd_db -= 20.0*math.log10(sample_rate)
+        np.sqrt(mag, out=mag)
+        if compute_pha:
+            np.arctan2(im, re, out=pha, casting='same_kind')
+
+    def u8_to_cf32(raw, out):
+        """
+        Converts interleaved uint8 IQ bytes from the device
+        into normalized float32 I/Q pairs using in-place
+        NumPy operations over the preallocated output
+        buffer. Viewing the output buffer as complex64
+        yields the normalized samples.
+
+        Parameters
+        ----------
+        * raw                           : (np.array) Interleaved uint8 IQ bytes.
+        * out                           : (np.array) Preallocated float32 output buffer
+                                            of the same size as raw.
+        """
+        np.subtract(raw, _IQ_BIAS, out=out)
+        out *= _IQ_SCALE
@@ -1,8 +1,27 @@
+import weakref
+import threading
 import numpy as np
-from ctypes import c_void_p
-from pysdr.rtlsdr_apis import librtlsdr
+from ctypes import c_void_p, c_ubyte, addressof
+from pysdr.kernels import u8_to_cf32
+from pysdr.rtlsdr_apis import get_librtlsdr, rtlsdr_read_async_cb_t
 from pysdr.utils import print_error_msg, print_info_msg, print_success_msg, print_warn_msg
 
+def _close_device_handle(clib, dev_ptr):
+    """
+    Closes the libusb connection held by dev_ptr if it is
+    still open. Registered as the weakref finalizer for
+    Radio objects so collection of an unclosed radio
+    releases the device without relying on __del__.
+
+    Parameters
+    ----------
+    * clib                                  : (librtlsdr) Wrapper holding the loaded library.
+    * dev_ptr                               : (c_void_p) Device handle pointer.
+    """
+    if dev_ptr.value is not None:
+        clib.py_rtlsdr_close(dev_ptr)
+        dev_ptr.value = None
+
 class Radio:
     """
     Creates an object to interact with the RTL-SDR
@@ -36,27 +55,27 @@ class Radio:
     * enable_auto_tuner_gain                * (bool) Gain selection mode of the tuner. Auto - True, manual - False.
     * tuner_xo_freq                         * (int) Tuner crystal frequency in Hz.
     * rtl_xo_freq                           * (int) RTL2832 crystal frequency in Hz.
-    * num_recv_samples                      * (np.array) Number of samples to read from the SDR. 
+    * num_recv_samples                      * (np.array) Number of samples to read from the SDR.
+    * freq_axis_mhz                         * (np.array) Frequency axis in MHz for a received frame.
 
     """
 
     def __init__(self, device_index, logging_level=3):
-        self.__librtlsdr = librtlsdr()
+        self.__librtlsdr = get_librtlsdr()
 
-        if int(device_index) != device_index:
+        # isinstance is a single type check instead of a full int
+        # conversion plus comparison. bool is excluded explicitly so
+        # True cannot slip through as device index 1.
+        if not isinstance(device_index, int) or isinstance(device_index, bool):
             print_error_msg("Expected device index to be of int. Got: %s."%(type(device_index)))
             raise TypeError
-        
-        device_index = int(device_index)
 
         self.__device_index = device_index
 
-        if int(logging_level) != logging_level:
+        if not isinstance(logging_level, int) or isinstance(logging_level, bool):
             print_error_msg("Expected logging level to be int. Got: %s"%(type(logging_level)))
             raise TypeError
 
-        logging_level = int(logging_level)
-
         if logging_level < 1 or logging_level > 4:
             print_error_msg("Invalid logging level %d."%(logging_level))
             raise ValueError
@@ -67,7 +86,13 @@ class Radio:
         # Open a device pointer to the SDR.
         self.__dev_ptr = c_void_p(None)
         self.__dev_ptr = self.clib.py_rtlsdr_open(device_index)
-        
+        # The finalizer closes the device if the object is
+        # collected without an explicit close(), avoiding the
+        # attribute-lookup hazards of __del__ during interpreter
+        # shutdown. close() detaches it once the handle is released.
+        self.__finalizer = weakref.finalize(self, _close_device_handle,
+                                            self.__librtlsdr, self.__dev_ptr)
+
         if self.__logging_level == 1:
             print_success_msg("Successfully opened a libusb connection to the device.")
 
@@ -81,12 +106,37 @@ class Radio:
         self.__center_freq = None
         self.__sample_rate = None
         self.__enable_agc = None
-        self.__tuner_gain = None
         self.__enable_auto_tuner_gain = None
         self.__tuner_gains = self.clib.py_rtlsdr_get_tuner_gains(self.__dev_ptr)
+        self.__tuner_gain = self.clib.py_rtlsdr_get_tuner_gain(self.__dev_ptr)
         self.__freq_correction = self.clib.py_rtlsdr_get_freq_correction(self.__dev_ptr)
         self.__rtl_xo_freq, self.__tuner_xo_freq = self.clib.py_rtlsdr_get_xtal_freq(self.__dev_ptr)
         self.__num_recv_samples = None
+        self.__iq_f32 = None
+        self.__samples_c64 = None
+        self.__read_buf = None
+        self.__read_np = None
+        self.__snap_buf = None
+        # Batch receive buffers, allocated lazily on the first
+        # rx_samples call with n_frames > 1.
+        self.__batch_frames = 0
+        self.__batch_f32 = None
+        self.__batch_c64 = None
+        self.__batch_raw = None
+        self.__freq_axis_mhz = None
+        self.__repr_cache = None
+
+        # Streaming state. The ring buffer and the callback are
+        # allocated when start_stream is called.
+        self.__stream_thread = None
+        self.__stream_cb = None
+        self.__ring_buf = None
+        self.__ring_size = 0
+        self.__ring_write_idx = 0
+        self.__frame_ready = threading.Event()
+        self.__stream_error = None
+        self.__cb_nbytes = 0
+        self.__cb_buf_t = None
 
         # Init defaults
         self.__init_default()
@@ -107,7 +157,6 @@ class Radio:
     
     @property
     def tuner_gain(self):
-        self.__tuner_gain = self.clib.py_rtlsdr_get_tuner_gain(self.__dev_ptr)
         return self.__tuner_gain
     
     @property
@@ -120,7 +169,6 @@ class Radio:
 
     @property
     def freq_correction(self):
-        self.__freq_correction = self.clib.py_rtlsdr_get_freq_correction(self.__dev_ptr)
         return self.__freq_correction
     
     @property
@@ -137,60 +185,117 @@ class Radio:
     
     @property
     def center_freq(self):
-        self.__center_freq = self.clib.py_rtlsdr_get_center_freq(self.__dev_ptr)
         return self.__center_freq
     
     @property
     def sample_rate(self):
-        self.__sample_rate = self.clib.py_rtlsdr_get_sample_rate(self.__dev_ptr)
         return self.__sample_rate
     
     @property
     def enable_agc(self):
         return self.__enable_agc
     
+    @property
+    def freq_axis_mhz(self):
+        """
+        Frequency axis in MHz corresponding to the FFT of a
+        received frame. Lazily computed and cached. The cache
+        is invalidated whenever center_freq, sample_rate or
+        num_recv_samples change.
+        """
+        if self.__freq_axis_mhz is None:
+            center_freq = self.center_freq
+            sample_rate = self.sample_rate
+            self.__freq_axis_mhz = np.linspace(center_freq - sample_rate/2,
+                                               center_freq + sample_rate/2,
+                                               self.num_recv_samples,
+                                               endpoint=False) / 1e6
+            self.__freq_axis_mhz = self.__freq_axis_mhz.astype(np.float32)
+        return self.__freq_axis_mhz
+
+    def __invalidate_freq_axis(self):
+        """
+        Drops the cached frequency axis. Called from the
+        setters which change the axis.
+        """
+        self.__freq_axis_mhz = None
+
+    def __invalidate_repr(self):
+        """
+        Drops the cached repr string. Called from the
+        setters and refresh, since every state mutation
+        flows through them.
+        """
+        self.__repr_cache = None
+
     @property
     def tuner_xo_freq(self):
-        _, self.__tuner_xo_freq = self.clib.py_rtlsdr_get_xtal_freq(self.__dev_ptr)
         return self.__tuner_xo_freq
     
     @property
     def rtl_xo_freq(self):
-        self.__rtl_xo_freq, _ = self.clib.py_rtlsdr_get_xtal_freq(self.__dev_ptr)
         return self.__rtl_xo_freq
-    
+
+    def refresh(self):
+        """
+        Re-reads the device state from the driver into the
+        Python-side shadow copies served by the property
+        getters. The shadows are maintained by the setters,
+        so this is only needed when the device state may
+        have changed outside of this object (e.g. another
+        process re-tuned the device).
+
+        Raises
+        ------
+        * ValueError
+                                                * If any of the underlying reads
+                                                    fails.
+        """
+        self.__center_freq = self.clib.py_rtlsdr_get_center_freq(self.__dev_ptr)
+        self.__sample_rate = self.clib.py_rtlsdr_get_sample_rate(self.__dev_ptr)
+        self.__freq_correction = self.clib.py_rtlsdr_get_freq_correction(self.__dev_ptr)
+        self.__tuner_gain = self.clib.py_rtlsdr_get_tuner_gain(self.__dev_ptr)
+        self.__rtl_xo_freq, self.__tuner_xo_freq = self.clib.py_rtlsdr_get_xtal_freq(self.__dev_ptr)
+        self.__invalidate_freq_axis()
+        self.__invalidate_repr()
+
     @freq_correction.setter
     def freq_correction(self, ppm):
         self.clib.py_rtlsdr_set_freq_correction(self.__dev_ptr, ppm)
-        self.__freq_correction = ppm
-        
-        returned_freq_correction = self.clib.py_rtlsdr_get_freq_correction(self.__dev_ptr)
+        self.__freq_correction = int(ppm)
+        self.__invalidate_repr()
+
         if self.__logging_level == 1:
             print_success_msg("Freq correct is set to %d ppm"%(ppm))
     
     @center_freq.setter
     def center_freq(self, freq):
         self.clib.py_rtlsdr_set_center_freq(self.__dev_ptr, freq)
-        self.__center_freq = freq
+        self.__center_freq = int(freq)
+        self.__invalidate_freq_axis()
+        self.__invalidate_repr()
         
-        returned_center_freq = self.clib.py_rtlsdr_get_center_freq(self.__dev_ptr)
         if self.__logging_level == 1:
+            returned_center_freq = self.clib.py_rtlsdr_get_center_freq(self.__dev_ptr)
             print_success_msg("Device center freq is set to %d Hz."%(returned_center_freq))
 
     
     @sample_rate.setter
     def sample_rate(self, rate):
         self.clib.py_rtlsdr_set_sample_rate(self.__dev_ptr, rate)
-        self.__sample_rate = rate
+        self.__sample_rate = int(rate)
+        self.__invalidate_freq_axis()
+        self.__invalidate_repr()
 
-        returned_sample_rate = self.clib.py_rtlsdr_get_sample_rate(self.__dev_ptr)
         if self.__logging_level == 1:
+            returned_sample_rate = self.clib.py_rtlsdr_get_sample_rate(self.__dev_ptr)
             print_success_msg("Device sample rate is set to %d Hz."%(returned_sample_rate))
 
     @enable_agc.setter
     def enable_agc(self, enable):
         self.clib.py_rtlsdr_set_agc_mode(self.__dev_ptr, enable=enable)
         self.__enable_agc = enable
+        self.__invalidate_repr()
         if self.__logging_level == 1:
             if enable:
                 print_success_msg("Device internal AGC is enabled.")
@@ -206,16 +311,30 @@ class Radio:
         self.__enable_auto_tuner_gain = False
         self.clib.py_rtlsdr_set_tuner_gain(self.__dev_ptr, gain)
         self.__tuner_gain = gain
+        self.__invalidate_repr()
         if self.__logging_level == 1:
             print_success_msg("Tuner gain is set to %d dB"%(gain))
         
     @num_recv_samples.setter
     def num_recv_samples(self, num_samples):
-        if type(num_samples) != int:
+        if not isinstance(num_samples, int) or isinstance(num_samples, bool):
             print_error_msg("Expected int. Got: %s"%(type(num_samples)))
             raise ValueError
-        
+
         self.__num_recv_samples = num_samples
+        self.__invalidate_freq_axis()
+        self.__invalidate_repr()
+        # Reallocate the IQ conversion and USB read buffers only
+        # when the frame size actually changes.
+        if self.__iq_f32 is None or self.__iq_f32.size != 2*num_samples:
+            self.__iq_f32 = np.empty(2*num_samples, dtype=np.float32)
+            self.__samples_c64 = self.__iq_f32.view(np.complex64)
+            self.__read_buf = (c_ubyte * (2*num_samples))()
+            # Persistent zero-copy view over the USB read buffer,
+            # so the synchronous receive path does not rebuild a
+            # numpy wrapper around the same memory on every frame.
+            self.__read_np = np.frombuffer(self.__read_buf, dtype=np.uint8)
+            self.__snap_buf = np.empty(2*num_samples, dtype=np.uint8)
     
     @enable_auto_tuner_gain.setter
     def enable_auto_tuner_gain(self, enable):
@@ -225,6 +344,7 @@ class Radio:
     
         self.clib.py_rtlsdr_set_tuner_gain_mode(self.__dev_ptr, manual=not enable)
         self.__enable_auto_tuner_gain = enable
+        self.__invalidate_repr()
         if self.__logging_level == 1:
             if enable:
                 print_success_msg("Tuner gain selection is set to auto.")
@@ -268,7 +388,12 @@ class Radio:
 
 
     def __repr__(self,):
-        object_str = str({'Device Index': self.__device_index, 
+        # The string is rebuilt only after a setter or refresh
+        # has invalidated the cache, so repeated repr calls in a
+        # polling loop are a single attribute load.
+        if self.__repr_cache is not None:
+            return self.__repr_cache
+        object_str = str({'Device Index': self.__device_index,
                            'Logging Level': self.__logging_level,
                            'Manufacturer': self.__mid,
                            'Vendor ID': self.__vid, 
@@ -284,58 +409,294 @@ class Radio:
                            'RTL2832 xtal freq (Hz)': self.rtl_xo_freq,
                            'Frame Size (samples/frame)': self.num_recv_samples
                            })
+        self.__repr_cache = object_str
         return object_str
     
-    def rx_samples(self):
+    def start_stream(self, ring_frames=16):
         """
-        Reads and returns the specifed number 
-        of IQ samples from the device.
+        Starts a background reader thread which continuously
+        streams IQ bytes from the device into a ring buffer.
+        While streaming is active, rx_samples returns the
+        latest received samples from the ring buffer instead
+        of blocking on a synchronous USB read.
 
-        Returns
-        -------
-        * samples                       :  (np.array) A numpy array of samples of 
-                                            complex type is returned. (Normalized)
+        Parameters
+        ----------
+        * ring_frames                   : (int) Capacity of the ring buffer
+                                            in frames of num_recv_samples
+                                            samples. Default: 16.
         """
-        frame_latency, raw_data = self.clib.py_rtlsdr_read_sync(self.__dev_ptr, self.num_recv_samples)
-        iq = raw_data.astype(np.float64).view(np.complex128)
-        iq /= 127.5
-        iq -= (1 + 1j)
-        
-        empirical_sample_rate = (self.num_recv_samples/frame_latency) * 1000
-        if empirical_sample_rate < self.sample_rate:
+        if self.__stream_thread is not None:
             if self.__logging_level < 4:
-                print_warn_msg("Empirical sample rate: %.4f MSPS. Requested sample rate: %d MSPS."%(empirical_sample_rate, self.sample_rate))
+                print_warn_msg("Streaming is already active. Skipping start stream.")
+            return
 
-        if self.__logging_level < 3:
-            print_info_msg("Empirical sample rate: %.4f MSPS. Requested sample rate: %d MSPS."%(empirical_sample_rate, self.sample_rate))
-            
-        return iq
-    
-    def close(self, ):
+        self.__ring_size = 2 * ring_frames * self.num_recv_samples
+        self.__ring_buf = np.zeros(self.__ring_size, dtype=np.uint8)
+        self.__ring_write_idx = 0
+        self.__frame_ready.clear()
+        self.__stream_error = None
+        # Request transfers sized to the frame (rounded up to the
+        # 512-byte multiple librtlsdr requires) and cache a ctypes
+        # array type of that length, so the callback can wrap the
+        # incoming buffer without re-creating the array type on
+        # every completion.
+        self.__cb_nbytes = max(512, ((2 * self.num_recv_samples + 511) // 512) * 512)
+        self.__cb_buf_t = c_ubyte * self.__cb_nbytes
+        self.__stream_cb = rtlsdr_read_async_cb_t(self.__on_stream_samples)
+        self.__stream_thread = threading.Thread(target=self.__stream_reader, daemon=True)
+        self.__stream_thread.start()
+        if self.__logging_level == 1:
+            print_success_msg("Started streaming samples from the device.")
+
+    def stop_stream(self):
         """
-        Closes the libusb connection to the SDR device.
+        Stops the background reader thread and cancels the
+        pending asynchronous read on the device.
         """
-        if self.__dev_ptr.value is not None:
-            self.clib.py_rtlsdr_close(self.__dev_ptr)
-            if self.__logging_level == 1:
-                print_success_msg("Successfully closed the libusb connection to the device.")
-        else:
+        if self.__stream_thread is None:
             if self.__logging_level < 4:
-                print_warn_msg("Device handle pointer is None. Skipping close libusb connection to the device.")
-        self.__dev_ptr = c_void_p(None)
+                print_warn_msg("Streaming is not active. Skipping stop stream.")
+            return
+
+        # The cancel is a no-op if the reader thread has not entered
+        # the asynchronous read yet, so retry it until the thread
+        # actually exits instead of joining unconditionally.
+        while self.__stream_thread.is_alive():
+            self.clib.py_rtlsdr_cancel_async(self.__dev_ptr)
+            self.__stream_thread.join(timeout=0.1)
+        self.__stream_thread = None
+        self.__stream_cb = None
+        if self.__logging_level == 1:
+            print_success_msg("Stopped streaming samples from the device.")
 
-    def __del__(self):
+    def __stream_reader(self):
         """
-        Device clearn up function. This function
-        is called when the object goes out of scope.
-        Closes the connection to the device.
+        Reader thread body. Blocks inside librtlsdr until
+        stop_stream cancels the asynchronous read. A failure
+        of the asynchronous read is recorded and any blocked
+        consumer is woken up, so it surfaces in rx_samples
+        instead of silently dying with the thread.
         """
+        try:
+            self.clib.py_rtlsdr_read_async(self.__dev_ptr, self.__stream_cb,
+                                           buf_len=self.__cb_nbytes)
+        except Exception as stream_error:
+            self.__stream_error = stream_error
+            self.__frame_ready.set()
 
-        if self.__dev_ptr.value is not None:
-            self.clib.py_rtlsdr_close(self.__dev_ptr)
-            if self.__logging_level == 1:
-                print_success_msg("Successfully closed the libusb connection to the device.")
+    def __on_stream_samples(self, buf_ptr, num_bytes, ctx):
+        """
+        Asynchronous read callback. Copies the received IQ
+        bytes into the ring buffer and signals that a frame
+        is available. Runs on the reader thread.
+        """
+        if num_bytes == self.__cb_nbytes:
+            data = np.frombuffer(self.__cb_buf_t.from_address(addressof(buf_ptr.contents)),
+                                 dtype=np.uint8)
         else:
-            if self.__logging_level < 4:
-                print_warn_msg("Device handle pointer is None. Skipping close libusb connection to the device.")
-        self.__dev_ptr = c_void_p(None)
\ No newline at end of file
+            data = np.ctypeslib.as_array(buf_ptr, shape=(num_bytes,))
+        write_idx = self.__ring_write_idx
+        end_idx = write_idx + num_bytes
+        if end_idx <= self.__ring_size:
+            self.__ring_buf[write_idx:end_idx] = data
+        else:
+            split = self.__ring_size - write_idx
+            self.__ring_buf[write_idx:] = data[:split]
+            self.__ring_buf[:end_idx - self.__ring_size] = data[split:]
+        self.__ring_write_idx = end_idx % self.__ring_size
+        self.__frame_ready.set()
+
+    def __snapshot_stream(self, snap=None):
+        """
+        Copies the newest IQ bytes from the ring buffer into
+        the given preallocated snapshot buffer (the single
+        frame snapshot buffer when omitted) and returns it.
+        Blocks until the reader thread has produced at least
+        one frame. No allocation takes place on this path.
+
+        Parameters
+        ----------
+        * snap                          : (np.array) Optional uint8 destination
+                                            buffer. Its size selects how many of
+                                            the newest bytes are copied.
+
+        Raises
+        ------
+        * ValueError
+                                        * If the reader thread died before
+                                            producing a frame.
+        """
+        # A bounded wait with a liveness check, so a reader thread
+        # that died before producing a frame raises instead of
+        # leaving the consumer blocked forever.
+        while not self.__frame_ready.wait(timeout=0.5):
+            if not self.__stream_thread.is_alive():
+                break
+        if self.__stream_error is not None:
+            print_error_msg("Streaming reader thread failed: %s"%(self.__stream_error))
+            raise ValueError
+        if not self.__frame_ready.is_set():
+            print_error_msg("Streaming reader thread exited before producing a frame.")
+            raise ValueError
+        if snap is None:
+            snap = self.__snap_buf
+        num_bytes = snap.size
+        end_idx = self.__ring_write_idx
+        start_idx = (end_idx - num_bytes) % self.__ring_size
+        if start_idx < end_idx:
+            snap[:] = self.__ring_buf[start_idx:end_idx]
+        else:
+            split = self.__ring_size - start_idx
+            snap[:split] = self.__ring_buf[start_idx:]
+            snap[split:] = self.__ring_buf[:end_idx]
+        return snap
+
+    def __convert_iq(self, raw_data):
+        """
+        Converts the interleaved uint8 IQ bytes read from
+        the device into normalized complex64 samples via
+        the u8_to_cf32 kernel, which writes into the
+        preallocated float32 buffer so no per-call
+        allocation takes place.
+
+        Parameters
+        ----------
+        * raw_data                      : (np.array) Interleaved uint8 IQ bytes.
+
+        Returns
+        -------
+        * samples                       : (np.array) Normalized complex64 samples
+                                            viewing the internal buffer.
+        """
+        u8_to_cf32(raw_data, self.__iq_f32)
+        return self.__samples_c64
+
+    def __ensure_batch_buffers(self, n_frames):
+        """
+        Allocates the batch receive buffers for the given
+        number of frames if the batch shape changed since
+        the last batched call.
+
+        Parameters
+        ----------
+        * n_frames                      : (int) Number of frames per batch.
+        """
+        num_samples = self.num_recv_samples
+        if self.__batch_frames == n_frames and self.__batch_c64.shape[1] == num_samples:
+            return
+        self.__batch_f32 = np.empty(2 * n_frames * num_samples, dtype=np.float32)
+        self.__batch_c64 = self.__batch_f32.view(np.complex64).reshape(n_frames, num_samples)
+        self.__batch_raw = np.empty(2 * n_frames * num_samples, dtype=np.uint8)
+        self.__batch_frames = n_frames
+
+    def rx_samples(self, n_frames=1):
+        """
+        Reads and returns the specifed number
+        of IQ samples from the device. If streaming is
+        active, the newest samples are snapshotted from
+        the ring buffer instead of performing a blocking
+        synchronous read.
+
+        When n_frames is greater than one, the newest
+        n_frames frames are returned as a (n_frames,
+        num_recv_samples) complex64 matrix, amortizing the
+        per-call Python overhead across the whole batch.
+
+        The returned array is a zero-copy view of the
+        internal conversion buffer and is overwritten by
+        the next rx_samples call. Copy it if the samples
+        need to outlive the frame.
+
+        Parameters
+        ----------
+        * n_frames                      : (int) Number of frames of num_recv_samples
+                                            samples to return. Default: 1.
+
+        Raises
+        ------
+        * ValueError
+                                        * If n_frames is not a positive int, or
+                                            exceeds the ring buffer capacity while
+                                            streaming.
+
+        Returns
+        -------
+        * samples                       :  (np.array) A numpy array of samples of
+                                            complex type is returned. (Normalized)
+        """
+        if not isinstance(n_frames, int) or isinstance(n_frames, bool) or n_frames < 1:
+            print_error_msg("Expected n_frames to be a positive int. Got: %s"%(n_frames))
+            raise ValueError
+
+        if n_frames > 1:
+            return self.__rx_batch(n_frames)
+
+        if self.__stream_thread is not None:
+            raw_data = self.__snapshot_stream()
+            return self.__convert_iq(raw_data)
+
+        frame_latency, _ = self.clib.py_rtlsdr_read_sync(self.__dev_ptr, self.num_recv_samples,
+                                                         self.__read_buf)
+        iq = self.__convert_iq(self.__read_np)
+
+        # Compute the empirical rate and format the messages only
+        # when the logging level can actually emit them.
+        if self.__logging_level < 4:
+            empirical_sample_rate = (self.num_recv_samples/frame_latency) * 1000
+            sample_rate = self.sample_rate
+            if empirical_sample_rate < sample_rate:
+                print_warn_msg("Empirical sample rate: %.4f MSPS. Requested sample rate: %d MSPS."%(empirical_sample_rate, sample_rate))
+
+            if self.__logging_level < 3:
+                print_info_msg("Empirical sample rate: %.4f MSPS. Requested sample rate: %d MSPS."%(empirical_sample_rate, sample_rate))
+
+        return iq
+
+    def __rx_batch(self, n_frames):
+        """
+        Fills and returns the (n_frames, num_recv_samples)
+        complex64 batch matrix. While streaming, the newest
+        n_frames frames are copied out of the ring buffer and
+        converted in a single kernel call; otherwise
+        n_frames blocking reads are performed and each frame
+        is converted into its row of the batch.
+
+        Parameters
+        ----------
+        * n_frames                      : (int) Number of frames per batch.
+        """
+        self.__ensure_batch_buffers(n_frames)
+        num_bytes = 2 * self.num_recv_samples
+
+        if self.__stream_thread is not None:
+            if n_frames * num_bytes > self.__ring_size:
+                print_error_msg("Requested %d frames but the ring buffer holds %d. Increase ring_frames in start_stream."%(n_frames, self.__ring_size//num_bytes))
+                raise ValueError
+            self.__snapshot_stream(self.__batch_raw)
+            u8_to_cf32(self.__batch_raw, self.__batch_f32)
+            return self.__batch_c64
+
+        for frame in range(n_frames):
+            self.clib.py_rtlsdr_read_sync(self.__dev_ptr, self.num_recv_samples,
+                                          self.__read_buf)
+            u8_to_cf32(self.__read_np, self.__batch_f32[frame*num_bytes:(frame + 1)*num_bytes])
+        return self.__batch_c64
+
+    def close(self, ):
+        """
+        Closes the libusb connection to the SDR device.
+        Calling close on an already closed radio is a no-op.
+        """
+        if self.__dev_ptr.value is None:
+            return
+        if self.__stream_thread is not None:
+            self.stop_stream()
+        self.clib.py_rtlsdr_close(self.__dev_ptr)
+        # The handle is mutated in place rather than rebound so the
+        # registered finalizer, which holds the same c_void_p object,
+        # sees the closed state and is detached as dead work.
+        self.__dev_ptr.value = None
+        self.__finalizer.detach()
+        if self.__logging_level == 1:
+            print_success_msg("Successfully closed the libusb connection to the device.")
\ No newline at end of file
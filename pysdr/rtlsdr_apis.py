@@ -1,8 +1,11 @@
+import os
+import operator
 import datetime
 import numpy as np
 from ctypes.util import find_library
-from pysdr.utils import print_error_msg, c_ubyte_ptr_to_string, cstr, print_warn_msg, print_info_msg
-from ctypes import CDLL, c_int32, c_ubyte, POINTER, c_uint32, c_int, c_void_p, c_uint, c_void_p, byref
+from pysdr import _rtlsdr_cffi
+from pysdr.utils import print_error_msg, cstr, print_warn_msg
+from ctypes import CDLL, CFUNCTYPE, c_int32, c_ubyte, c_char_p, POINTER, c_uint32, c_int, c_void_p, c_uint, c_void_p, byref, create_string_buffer
 
 """
 Re-defines the c_void_p as the
@@ -10,10 +13,20 @@ device handle.
 """
 p_rtlsdr_dev = c_void_p
 
+"""
+Callback type used by rtlsdr_read_async. The callback
+receives a pointer to the raw IQ byte buffer, the number
+of bytes in the buffer and the user context pointer.
+"""
+rtlsdr_read_async_cb_t = CFUNCTYPE(None, POINTER(c_ubyte), c_uint32, c_void_p)
+
 class librtlsdr:
 
     """
-    Responsible for loading the rtlsdr shared library. 
+    Responsible for loading the rtlsdr shared library.
+    The library is loaded lazily on the first API access,
+    so constructing this class is cheap for code paths
+    that never talk to the hardware.
     The librtlsdr must be installed on the system.
     The installation can be done by following the 
     instructions from https://osmocom.org/projects/rtl-sdr/wiki/Rtl-sdr.
@@ -29,37 +42,135 @@ class librtlsdr:
     """
 
     def __init__(self, ):
-        
+
+        # The shared library is loaded lazily by __load_clib on
+        # the first FFI access, so constructing this class costs
+        # nothing for code paths that never touch the hardware.
+        self.__clib = None
+
+        # Cached device count used by the internal validation
+        # helpers. Invalidated on open/close so attach/detach
+        # between sessions is still picked up.
+        self.__device_count_cache = None
+
+        # Supported gain values per device handle address. The
+        # gain set is fixed per tuner model, so it is queried once
+        # and kept as a frozenset for O(1) membership tests in
+        # py_rtlsdr_set_tuner_gain. Dropped when the handle closes.
+        self.__gains_cache = {}
+
+        # Pooled ctypes scratch objects reused across calls, so the
+        # query wrappers do not reconstruct ctypes buffers on every
+        # invocation. The C calls fully overwrite the parts that are
+        # read back, so the buffers are not zeroed between calls.
+        # Access to them is not synchronized; the wrappers are meant
+        # to be driven from a single control thread.
+        self.__usb_mid = create_string_buffer(256)
+        self.__usb_pid = create_string_buffer(256)
+        self.__usb_serial = create_string_buffer(256)
+        self.__gain_scratch = (c_int * 50)()
+        self.__xtal_rtl = c_uint32()
+        self.__xtal_tuner = c_uint32()
+        # byref() builds a fresh CArgObject per call, so the two
+        # references used by the xtal-freq poll are built once here.
+        self.__xtal_rtl_ref = byref(self.__xtal_rtl)
+        self.__xtal_tuner_ref = byref(self.__xtal_tuner)
+
+    def __load_clib(self):
+        """
+        Loads the librtlsdr shared library, registers the API
+        prototypes and binds the function pointers as instance
+        attributes. Runs once, on the first FFI access.
+
+        Raises
+        ------
+        * ValueError:
+                                    * If the librtlsdr is not found on the system.
+        """
+
         # Load librtlsdr library
         crtlsdr_shared_lib = 'rtlsdr.so'
         if find_library(crtlsdr_shared_lib) is None:
             print_error_msg("Unable to find librtlsdr.so. Make sure to install it from https://osmocom.org/projects/rtl-sdr/wiki/Rtl-sdr.")
             raise ValueError
-        
+
         crtlsdr_shared_lib = find_library(crtlsdr_shared_lib)
 
         self.__clib = CDLL(crtlsdr_shared_lib)
 
-        # API's init status
-        self.__apis_init_stat = {}
-        for api_name in dir(librtlsdr):
-            if "py_rtlsdr" in api_name:
-                self.__apis_init_stat[api_name] = False
-    
+        # Register the restype/argtypes prototypes of all the
+        # librtlsdr APIs once, so the py_rtlsdr_* wrappers make a
+        # single C call without any per-call initialization checks.
+        api_prototypes = {
+            'rtlsdr_get_device_count': (c_uint32, []),
+            'rtlsdr_get_device_name': (c_char_p, [c_uint32]),
+            'rtlsdr_get_device_usb_strings': (c_int, [c_uint32, c_char_p, c_char_p, c_char_p]),
+            'rtlsdr_get_index_by_serial': (c_int, [c_char_p]),
+            'rtlsdr_open': (c_int, [POINTER(p_rtlsdr_dev), c_uint]),
+            'rtlsdr_close': (c_int, [p_rtlsdr_dev]),
+            'rtlsdr_get_xtal_freq': (c_int, [p_rtlsdr_dev, POINTER(c_uint32), POINTER(c_uint32)]),
+            'rtlsdr_set_center_freq': (c_int, [p_rtlsdr_dev, c_uint32]),
+            'rtlsdr_get_center_freq': (c_uint, [p_rtlsdr_dev]),
+            'rtlsdr_set_tuner_gain': (c_int, [p_rtlsdr_dev, c_int]),
+            'rtlsdr_get_tuner_gains': (c_int, [p_rtlsdr_dev, POINTER(c_int)]),
+            'rtlsdr_get_tuner_gain': (c_int, [p_rtlsdr_dev]),
+            'rtlsdr_set_freq_correction': (c_int, [p_rtlsdr_dev, c_int]),
+            'rtlsdr_get_freq_correction': (c_int, [p_rtlsdr_dev]),
+            'rtlsdr_set_agc_mode': (c_int, [p_rtlsdr_dev, c_int]),
+            'rtlsdr_set_sample_rate': (c_int, [p_rtlsdr_dev, c_uint32]),
+            'rtlsdr_get_sample_rate': (c_uint32, [p_rtlsdr_dev]),
+            'rtlsdr_set_tuner_gain_mode': (c_int, [p_rtlsdr_dev, c_int]),
+            'rtlsdr_reset_buffer': (c_int, [p_rtlsdr_dev]),
+            'rtlsdr_read_sync': (c_int, [p_rtlsdr_dev, c_void_p, c_int, POINTER(c_int)]),
+            'rtlsdr_read_async': (c_int, [p_rtlsdr_dev, rtlsdr_read_async_cb_t, c_void_p, c_uint32, c_uint32]),
+            'rtlsdr_cancel_async': (c_int, [p_rtlsdr_dev]),
+        }
+        # The bound function objects are also stored as instance
+        # attributes (e.g. self._rtlsdr_get_device_count), so the
+        # py_rtlsdr_* wrappers make the C call with a single
+        # attribute lookup and no dict indirection.
+        for api_name, (restype, argtypes) in api_prototypes.items():
+            f = getattr(self.__clib, api_name)
+            f.restype, f.argtypes = restype, argtypes
+            setattr(self, '_' + api_name, f)
+
+        # Optionally rebind the hot polled getters on top of the
+        # cffi ABI-mode backend, which skips most of the libffi
+        # trampoline for these primitive signatures. The ctypes
+        # bindings above stay the default and the fallback.
+        if os.environ.get('PYSDR_FFI_BACKEND') == 'cffi':
+            ffi, cffi_lib = _rtlsdr_cffi.load()
+            if cffi_lib is not None:
+                cast = ffi.cast
+                self._rtlsdr_get_center_freq = lambda h: cffi_lib.rtlsdr_get_center_freq(cast('void *', h.value))
+                self._rtlsdr_get_sample_rate = lambda h: cffi_lib.rtlsdr_get_sample_rate(cast('void *', h.value))
+                self._rtlsdr_get_tuner_gain = lambda h: cffi_lib.rtlsdr_get_tuner_gain(cast('void *', h.value))
+                self._rtlsdr_get_freq_correction = lambda h: cffi_lib.rtlsdr_get_freq_correction(cast('void *', h.value))
+
+    def __getattr__(self, name):
+        # The bound _rtlsdr_* function pointers are created by
+        # __load_clib on first use; after that they live in the
+        # instance dict and this hook is never entered again.
+        if name.startswith('_rtlsdr_'):
+            self.__load_clib()
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+        raise AttributeError(name)
+
     @property
     def clib(self):
+        if self.__clib is None:
+            self.__load_clib()
         return self.__clib
-    
+
     def py_rtlsdr_get_device_count(self,):
         """
         Returns the number of RTL-SDR devices
         connected to the host.
         """
-        if not self.__apis_init_stat['py_rtlsdr_get_device_count']:
-            f = self.clib.rtlsdr_get_device_count
-            f.restype, f.argstypes = c_uint32, []
-            self.__apis_init_stat['py_rtlsdr_get_device_count'] = True
-        return self.clib.rtlsdr_get_device_count()
+        return self._rtlsdr_get_device_count()
     
     def py_rtlsdr_get_device_name(self, device_index=0):
         """
@@ -78,30 +189,109 @@ class librtlsdr:
                                     * If device index is negative.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_device_name']:
-            f = self.clib.rtlsdr_get_device_name
-            f.restype, f.argstypes = POINTER(c_ubyte), [c_uint32]
-            self.__apis_init_stat['py_rtlsdr_get_device_name'] = True
-        
-        self.__check_for_rtlsdr_devices()
-        
-        if int(device_index) != device_index:
-            print_error_msg("Expected device index to be int. Got: %d"%(type(device_index)))
-            raise ValueError
+        device_index = self.__validate_device_index(device_index)
+
+        device_name = self._rtlsdr_get_device_name(c_uint32(device_index))
+        return device_name.decode('ascii', 'replace')
     
-        device_index = int(device_index)
+    def __get_device_count_cached(self):
+        """
+        Returns the cached number of connected RTL-SDR
+        devices, querying the device count from librtlsdr
+        only when the cache is empty. Used by the internal
+        validation helpers to avoid a USB enumeration per
+        validated call.
+        """
+        if self.__device_count_cache is None:
+            self.__device_count_cache = self._rtlsdr_get_device_count()
+        return self.__device_count_cache
+
+    @staticmethod
+    def __coerce_to_int(value):
+        """
+        Returns value as a plain int. Accepts any integral
+        type via operator.index (a single C-level check that
+        also covers NumPy integer scalars) plus floats that
+        carry an integral value, which the public setters
+        have always accepted (e.g. center_freq = 433e6).
+
+        Parameters
+        ----------
+        * value                         : (int) Value to coerce.
+
+        Returns
+        -------
+        * value                         : (int) The coerced value.
+
+        Raises
+        ------
+        * TypeError                     : If value is not integral. The callers
+                                            translate this into their documented
+                                            exception type.
+        """
+        if type(value) is int:
+            return value
+        try:
+            return operator.index(value)
+        except TypeError:
+            if isinstance(value, float) and value.is_integer():
+                return int(value)
+            raise
+
+    def __validate_device_index(self, device_index):
+        """
+        Validates the device index against the number of
+        connected devices and returns it as a plain int.
+        operator.index accepts any integral type (including
+        NumPy integer scalars) and rejects floats, without
+        the double coercion of the old int(x) != x idiom.
+
+        Parameters
+        ----------
+        * device_index                  : (int) Device index.
+
+        Returns
+        -------
+        * device_index                  : (int) Validated device index.
 
-        if device_index < 0:
-            print_error_msg("Device index must be non-negative.")
+        Raises
+        ------
+        * ValueError
+                                        * If device index is not an integer.
+                                        * If device index is out of range of
+                                            the connected devices.
+        """
+        self.__check_for_rtlsdr_devices()
+        try:
+            device_index = operator.index(device_index)
+        except TypeError:
+            print_error_msg("Expected device index to be int. Got: %s"%(type(device_index)))
             raise ValueError
-        
-        if device_index >= self.py_rtlsdr_get_device_count():
-            print_error_msg("Expected device index < %d. Got device index: %d."%(self.py_rtlsdr_get_device_count(), device_index))
+        device_count = self.__get_device_count_cached()
+        if not 0 <= device_index < device_count:
+            print_error_msg("Expected device index in [0, %d). Got device index: %d."%(device_count, device_index))
+            raise ValueError
+        return device_index
+
+    def __validate_handle(self, device_handle_ptr):
+        """
+        Validates that the device handle pointer refers to
+        an opened device. Unlike __check_for_rtlsdr_devices
+        this does not enumerate the USB bus, since an open
+        handle already proves a device is attached.
+
+        Parameters
+        ----------
+        * device_handle_ptr             : (p_rtlsdr_dev) Device handle pointer.
+
+        Raises
+        ------
+        * ValueError                    : If the device handle is not open.
+        """
+        if not device_handle_ptr:
+            print_error_msg("Expected an open device handle. Make sure to call py_rtlsdr_open first.")
             raise ValueError
 
-        device_name = self.clib.rtlsdr_get_device_name(c_uint32(device_index))
-        return c_ubyte_ptr_to_string(device_name, 126)
-    
     def __check_for_rtlsdr_devices(self):
         """
         Checks whether any RTL-SDR device
@@ -111,7 +301,7 @@ class librtlsdr:
         ------
         * ValueError                    : No device is found.
         """
-        if self.py_rtlsdr_get_device_count() == 0:
+        if self.__get_device_count_cached() == 0:
             print_error_msg("No RTL-SDR device is attached to the host.")
             raise ValueError
       
@@ -137,38 +327,19 @@ class librtlsdr:
                                         equal to the number of connected 
                                         supported devices.
         """
-        if not self.__apis_init_stat['py_rtlsdr_get_device_usb_strings']:
-            f = self.clib.rtlsdr_get_device_usb_strings
-            f.restype, f.argstypes = c_int, [c_uint32, POINTER(c_ubyte), POINTER(c_ubyte), POINTER(c_ubyte)]
-            self.__apis_init_stat['py_rtlsdr_get_device_usb_strings'] = True
-        
-        self.__check_for_rtlsdr_devices()
-
-        if int(device_index) != device_index:
-            print_error_msg("Expected device index to be int. Got: %d"%(type(device_index)))
-            raise ValueError
-    
-        device_index = int(device_index)
-
-        if device_index < 0:
-            print_error_msg("Device index must be non-negative.")
-            raise ValueError
-        
-        if device_index >= self.py_rtlsdr_get_device_count():
-            print_error_msg("Expected device index < %d. Got device index: %d."%(self.py_rtlsdr_get_device_count(), device_index))
-            raise ValueError
+        device_index = self.__validate_device_index(device_index)
 
-        mid = (c_ubyte * 256)()
-        pid = (c_ubyte * 256)()
-        serial = (c_ubyte * 256)()
-        result = self.clib.rtlsdr_get_device_usb_strings(c_uint32(device_index),
+        mid = self.__usb_mid
+        pid = self.__usb_pid
+        serial = self.__usb_serial
+        result = self._rtlsdr_get_device_usb_strings(c_uint32(device_index),
                                                           mid,
                                                           pid,
                                                           serial)
         if(result != 0):
             print_error_msg("Failed tp fetch USB device strings for device indexed as %d."%(device_index))
             raise ValueError
-        return c_ubyte_ptr_to_string(mid, 256), c_ubyte_ptr_to_string(pid, 256), c_ubyte_ptr_to_string(serial, 256)
+        return mid.value.decode('ascii', 'replace'), pid.value.decode('ascii', 'replace'), serial.value.decode('ascii', 'replace')
     
     def py_rtlsdr_get_index_by_serial(self, serial_id):
         """
@@ -193,11 +364,6 @@ class librtlsdr:
                                             to device index.
         """
         
-        if not self.__apis_init_stat['py_rtlsdr_get_index_by_serial']:
-            f = self.clib.rtlsdr_get_index_by_serial
-            f.restype, f.argstypes = c_int, [POINTER(c_ubyte)]
-            self.__apis_init_stat['py_rtlsdr_get_index_by_serial'] = True
-
         self.__check_for_rtlsdr_devices()        
 
         if type(serial_id) != str:
@@ -205,7 +371,7 @@ class librtlsdr:
             raise ValueError
         
         cserial_id = cstr(serial_id)
-        result = self.clib.rtlsdr_get_index_by_serial(cserial_id)
+        result = self._rtlsdr_get_index_by_serial(cserial_id)
         if(result < 0):
             print_warn_msg("Failed to fetch any device with serial id: %s"%(serial_id))
             return None
@@ -231,30 +397,12 @@ class librtlsdr:
         * handle                     : (p_rtlsdr_dev) Device handle.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_open']:
-            f = self.clib.rtlsdr_open
-            f.restype, f.argtypes = c_int, [POINTER(p_rtlsdr_dev), c_uint]
-            self.__apis_init_stat['py_rtlsdr_open'] = True
-
-        self.__check_for_rtlsdr_devices()
-
-        if int(device_index) != device_index:
-            print_error_msg("Expected device index to be int. Got: %d"%(type(device_index)))
-            raise ValueError
-    
-        device_index = int(device_index)
-
-        if device_index < 0:
-            print_error_msg("Device index must be non-negative.")
-            raise ValueError
-        
-        if device_index >= self.py_rtlsdr_get_device_count():
-            print_error_msg("Expected device index < %d. Got device index: %d."%(self.py_rtlsdr_get_device_count(), device_index))
-            raise ValueError
+        self.__device_count_cache = None
+        device_index = self.__validate_device_index(device_index)
         
         dev_p = p_rtlsdr_dev(None)
         c_device_index = c_uint(device_index)
-        result = self.clib.rtlsdr_open(dev_p, c_uint(device_index))
+        result = self._rtlsdr_open(dev_p, c_uint(device_index))
         
         if result == -1:
             print_error_msg("Device or libusb is inaccessible.")
@@ -284,14 +432,11 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_close']:
-            f = self.clib.rtlsdr_close
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_close'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(dev_handle_ptr)
 
-        result = self.clib.rtlsdr_close(dev_handle_ptr)
+        result = self._rtlsdr_close(dev_handle_ptr)
+        self.__device_count_cache = None
+        self.__gains_cache.pop(dev_handle_ptr.value, None)
         if result != 0:
             print_error_msg("Failed to close device handle for device index: %d."%(device_index))
             raise ValueError
@@ -318,24 +463,16 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_xtal_freq']:
-            f = self.clib.rtlsdr_get_xtal_freq
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, POINTER(c_uint32), POINTER(c_uint32)]
-            self.__apis_init_stat['py_rtlsdr_get_xtal_freq'] = True
+        self.__validate_handle(device_handle_ptr)
 
-        self.__check_for_rtlsdr_devices()
-
-        rtl_freq = c_uint32(0)
-        tuner_freq = c_uint32(0)
+        result  = self._rtlsdr_get_xtal_freq(device_handle_ptr,
+                                       self.__xtal_rtl_ref,
+                                       self.__xtal_tuner_ref)
 
-        result  = self.clib.rtlsdr_get_xtal_freq(device_handle_ptr, 
-                                                  byref(rtl_freq),
-                                                  byref(tuner_freq))
-        
         if result != 0:
             print_error_msg("Failed to fetch xtal freq. of tuner and RTL2832 chip.")
             raise ValueError
-        return rtl_freq.value, tuner_freq.value
+        return self.__xtal_rtl.value, self.__xtal_tuner.value
     
     def py_rtlsdr_set_center_freq(self, device_handle_ptr, center_freq):
         """
@@ -356,24 +493,19 @@ class librtlsdr:
                                                 * If type of center freq is not int.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_set_center_freq']:
-            f = self.clib.rtlsdr_set_center_freq
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_uint32]
-            self.__apis_init_stat['py_rtlsdr_set_center_freq'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        if int(center_freq) != center_freq:
+        try:
+            center_freq = self.__coerce_to_int(center_freq)
+        except TypeError:
             print_error_msg("Expected center freq to be int. Got: %s"%(type(center_freq)))
             raise TypeError
-        
-        center_freq = int(center_freq)
 
         if center_freq <= 0:
             print_error_msg("Expected center freq > 0. Got: %d"%(center_freq))
             raise ValueError
 
-        result = self.clib.rtlsdr_set_center_freq(device_handle_ptr, c_uint32(center_freq))
+        result = self._rtlsdr_set_center_freq(device_handle_ptr, c_uint32(center_freq))
         if result != 0:
             print_error_msg("Failed to set center freq to: %d Hz."%(center_freq))
             raise ValueError
@@ -400,14 +532,9 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_center_freq']:
-            f = self.clib.rtlsdr_get_center_freq
-            f.restype, f.argtypes = c_uint, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_get_center_freq'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
         
-        center_freq = self.clib.rtlsdr_get_center_freq(device_handle_ptr)
+        center_freq = self._rtlsdr_get_center_freq(device_handle_ptr)
         if center_freq == 0:
             print_error_msg("Failed to read the center freq of the tuner. Make sure to set the center freq before querying it.")
             raise ValueError
@@ -433,24 +560,22 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_set_tuner_gain']:
-            f = self.clib.rtlsdr_set_tuner_gain
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_int]
-            self.__apis_init_stat['py_rtlsdr_set_tuner_gain'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
         if float(gain) != gain:
             print_error_msg("Expected gain to be of type float. Got: %s", type(gain))
             raise TypeError
         
-        supported_gain_values = self.py_rtlsdr_get_tuner_gains(device_handle_ptr)
+        supported_gain_values = self.__gains_cache.get(device_handle_ptr.value)
+        if supported_gain_values is None:
+            supported_gain_values = frozenset(self.py_rtlsdr_get_tuner_gains(device_handle_ptr))
+            self.__gains_cache[device_handle_ptr.value] = supported_gain_values
         if gain not in supported_gain_values:
             print_error_msg("Invalid/Unsupported gain value %.1f dB is specified."%(gain))
             raise TypeError
         
         c_gain_value = int(gain * 10.0)
-        result = self.clib.rtlsdr_set_tuner_gain(device_handle_ptr, c_int(c_gain_value))
+        result = self._rtlsdr_set_tuner_gain(device_handle_ptr, c_int(c_gain_value))
         if result != 0:
             print_error_msg("Failed to set the specified gain value %.1f dB of the tuner."%(gain))
             raise ValueError
@@ -477,25 +602,21 @@ class librtlsdr:
                                                     of the tuner in dB.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_tuner_gains']:
-            f = self.clib.rtlsdr_get_tuner_gains
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, POINTER(c_int)]
-            self.__apis_init_stat['py_rtlsdr_get_tuner_gains'] = True
+        self.__validate_handle(device_handle_ptr)
 
-        self.__check_for_rtlsdr_devices()
+        c_gain_values_list = self.__gain_scratch
 
-        c_gain_values_list = [-1] * 50
-        c_gain_values_list = (c_int * len(c_gain_values_list))(*c_gain_values_list)
-        
-        result = self.clib.rtlsdr_get_tuner_gains(device_handle_ptr, c_gain_values_list)
+        result = self._rtlsdr_get_tuner_gains(device_handle_ptr, c_gain_values_list)
         if result <= 0:
             print_error_msg("Failed to read supported gain values for the tuner.")
             raise ValueError
         
-        gain_values = []
-        for idx in range(0, result):
-            gain_values.append(c_gain_values_list[idx]/10.0)
-        return gain_values
+        # Single C-level copy + vectorized divide instead of one
+        # ctypes indexed read and a float divide per element. The
+        # divide (rather than a multiply by 0.1) keeps the values
+        # bit-identical to the old per-element conversion.
+        gain_values = np.frombuffer(c_gain_values_list, dtype=np.int32, count=result)
+        return (gain_values / 10.0).tolist()
     
     def py_rtlsdr_get_tuner_gain(self, device_handle_ptr):
         """
@@ -518,14 +639,9 @@ class librtlsdr:
                                                     tuner in dB.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_tuner_gain']:
-            f = self.clib.rtlsdr_get_tuner_gain
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_get_tuner_gain'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        gain_value = self.clib.rtlsdr_get_tuner_gain(device_handle_ptr)
+        gain_value = self._rtlsdr_get_tuner_gain(device_handle_ptr)
         if gain_value < 0:
             print_warn_msg("Failed to read current tuner gain value.")
             raise ValueError
@@ -551,20 +667,15 @@ class librtlsdr:
                                                 * If frequency correction value is invalid.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_set_freq_correction']:
-            f = self.clib.rtlsdr_set_freq_correction
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_int]
-            self.__apis_init_stat['py_rtlsdr_set_freq_correction'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        if int(ppm) != ppm:
+        try:
+            ppm = self.__coerce_to_int(ppm)
+        except TypeError:
             print_error_msg("Expected ppm to be of type int. Got: %s"%(type(ppm)))
             raise ValueError
-        
-        ppm = int(ppm)
 
-        result = self.clib.rtlsdr_set_freq_correction(device_handle_ptr, c_int(ppm))
+        result = self._rtlsdr_set_freq_correction(device_handle_ptr, c_int(ppm))
         if result != 0:
             print_error_msg("Failed to do the freq correction by %d"%(ppm))
             raise ValueError
@@ -584,14 +695,9 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_freq_correction']:
-            f = self.clib.rtlsdr_get_freq_correction
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_get_freq_correction'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        freq_correction_value = self.clib.rtlsdr_get_freq_correction(device_handle_ptr)
+        freq_correction_value = self._rtlsdr_get_freq_correction(device_handle_ptr)
         return freq_correction_value
     
     def py_rtlsdr_set_agc_mode(self, device_handle_ptr, enable=True):
@@ -612,36 +718,19 @@ class librtlsdr:
         * TypeError   
                                                 * If enable is not of bool type.
         """
-        if not self.__apis_init_stat['py_rtlsdr_set_agc_mode']:
-            f = self.clib.rtlsdr_set_agc_mode
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_int]
-            self.__apis_init_stat['py_rtlsdr_set_agc_mode'] = True
+        self.__validate_handle(device_handle_ptr)
 
-        self.__check_for_rtlsdr_devices()
-
-        if bool(enable) != enable:
-            print_error_msg("Expected enable to be of bool type. Got: %s", type(enable))
+        if not isinstance(enable, bool):
+            print_error_msg("Expected enable to be of bool type. Got: %s"%(type(enable)))
             raise TypeError
 
-        enable = bool(enable)
+        enable_mode = 1 if enable else 0
 
-        if enable:
-            enable_mode = 1
-        else:
-            enable_mode = 0
-        
-        result = self.clib.rtlsdr_set_agc_mode(device_handle_ptr, c_int(enable_mode))
+        result = self._rtlsdr_set_agc_mode(device_handle_ptr, c_int(enable_mode))
         if result != 0:
-            print_error_msg("Failed to set internal agc mode to %d."%(enable_manual_mode))
+            print_error_msg("Failed to set internal agc mode to %d."%(enable_mode))
             raise ValueError
-        
-        """
-        if enable:
-            print_info_msg("RTL2832 internal AGC is enabled.")
-        else:
-            print_info_msg("RTL2832 internal AGC is disabled.")
-        """
-    
+
     def py_rtlsdr_set_sample_rate(self, device_handle_ptr, sample_rate):
         """
         Sets the sample rate of the device. 
@@ -663,20 +752,15 @@ class librtlsdr:
                                                 * If sample rate type/value is invalid.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_set_sample_rate']:
-            f = self.clib.rtlsdr_set_sample_rate
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_uint32]
-            self.__apis_init_stat['py_rtlsdr_set_sample_rate'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        if int(sample_rate) != sample_rate:
+        try:
+            sample_rate = self.__coerce_to_int(sample_rate)
+        except TypeError:
             print_error_msg("Expected sample_rate to be of type int. Got: %s"%(type(sample_rate)))
             raise ValueError
-        
-        sample_rate = int(sample_rate)
 
-        result = self.clib.rtlsdr_set_sample_rate(device_handle_ptr, c_uint32(sample_rate))
+        result = self._rtlsdr_set_sample_rate(device_handle_ptr, c_uint32(sample_rate))
         if result != 0:
             print_error_msg("Failed to set the device sample rate to %d Hz."%(sample_rate))
             raise ValueError
@@ -700,14 +784,9 @@ class librtlsdr:
         * sample_rate                           : (int) Returns the sample rate in Hz.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_get_sample_rate']:
-            f = self.clib.rtlsdr_get_sample_rate
-            f.restype, f.argtypes = c_uint32, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_get_sample_rate'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
         
-        sample_rate = self.clib.rtlsdr_get_sample_rate(device_handle_ptr)
+        sample_rate = self._rtlsdr_get_sample_rate(device_handle_ptr)
         if sample_rate == 0:
             print_error_msg("Failed to read the device sample rate.")
             raise ValueError
@@ -733,36 +812,19 @@ class librtlsdr:
                                                 * If manual is not of bool type.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_set_tuner_gain_mode']:
-            f = self.clib.rtlsdr_set_tuner_gain_mode
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_int]
-            self.__apis_init_stat['py_rtlsdr_set_tuner_gain_mode'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        if bool(manual) != manual:
-            print_error_msg("Expected manual to be of bool type. Got: %s", type(manual))
+        if not isinstance(manual, bool):
+            print_error_msg("Expected manual to be of bool type. Got: %s"%(type(manual)))
             raise TypeError
 
-        manual = bool(manual)
-        
-        if manual:
-            enable_manual_mode = 1
-        else:
-            enable_manual_mode = 0
-        
-        result = self.clib.rtlsdr_set_tuner_gain_mode(device_handle_ptr, c_int(enable_manual_mode))
+        enable_manual_mode = 1 if manual else 0
+
+        result = self._rtlsdr_set_tuner_gain_mode(device_handle_ptr, c_int(enable_manual_mode))
         if result != 0:
             print_error_msg("Failed to set tuner mode to %d."%(enable_manual_mode))
             raise ValueError
-        
-        """
-        if manual:
-            print_info_msg("LNA/Tuner gain mode is set to manual.")
-        else:
-            print_info_msg("LNA/Tuner gain mode is set to automatic")
-        """
-    
+
     def py_rtlsdr_reset_buffer(self, device_handle_ptr):
         """
         Resets the RTL2832 sample buffer.
@@ -776,22 +838,17 @@ class librtlsdr:
         * ValueError
                                                 * If fails to reset the buffer.
         """
-        if not self.__apis_init_stat['py_rtlsdr_reset_buffer']:
-            f = self.clib.rtlsdr_reset_buffer
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_reset_buffer'] = True
+        self.__validate_handle(device_handle_ptr)
 
-        self.__check_for_rtlsdr_devices()
-
-        result = self.clib.rtlsdr_reset_buffer(device_handle_ptr)
+        result = self._rtlsdr_reset_buffer(device_handle_ptr)
         if result != 0:
             print_error_msg("Failed to reset the RTL2832 sample buffer.")
             raise ValueError
     
-    def py_rtlsdr_read_sync(self, device_handle_ptr, samples_to_read):
+    def py_rtlsdr_read_sync(self, device_handle_ptr, samples_to_read, sample_bfr=None):
         """
         Reads and returns the IQ samples from the deivce
-        synchronously. Each sample is 16 bits. 
+        synchronously. Each sample is 16 bits.
         First 8 bits denote I and next 8 bits denotes Q sample.
 
         Parameters
@@ -799,6 +856,10 @@ class librtlsdr:
         * dev_handle_ptr                        : (p_rtlsdr_dev) Device handle pointer.
         * samples_to_read                       : (int) Number of samples to read from the
                                                     device.
+        * sample_bfr                            : (c_ubyte array) Optional preallocated buffer
+                                                    of 2*samples_to_read bytes to read into.
+                                                    When omitted a fresh buffer is allocated
+                                                    per call.
 
         Raises
         ------
@@ -816,29 +877,28 @@ class librtlsdr:
         * raw_samples                           : (np.array) List of raw samples read from the device.
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_read_sync']:
-            f = self.clib.rtlsdr_read_sync
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev, c_void_p, c_int, POINTER(c_int)]
-            self.__apis_init_stat['py_rtlsdr_read_sync'] = True
-
-        self.__check_for_rtlsdr_devices()
+        self.__validate_handle(device_handle_ptr)
 
-        if int(samples_to_read) != samples_to_read:
+        try:
+            samples_to_read = self.__coerce_to_int(samples_to_read)
+        except TypeError:
             print_error_msg("Expected samples_to_read of type int. Got: %s"%(type(samples_to_read)))
             raise TypeError
 
-        samples_to_read = int(samples_to_read)
-
         if samples_to_read <= 0:
             print_error_msg("Number of samples to read from device should be atleast one. Got: %d"%(samples_to_read))
             raise ValueError
 
         num_bytes = 2*samples_to_read
-        sample_bfr = (c_ubyte * num_bytes)()
+        if sample_bfr is None:
+            sample_bfr = (c_ubyte * num_bytes)()
+        elif len(sample_bfr) != num_bytes:
+            print_error_msg("Expected sample_bfr of %d bytes. Got: %d bytes."%(num_bytes, len(sample_bfr)))
+            raise ValueError
         num_bytes_read = c_int(-1)
 
         start_time = datetime.datetime.now()
-        result = self.clib.rtlsdr_read_sync(device_handle_ptr, sample_bfr,  c_int(num_bytes), num_bytes_read)
+        result = self._rtlsdr_read_sync(device_handle_ptr, sample_bfr,  c_int(num_bytes), num_bytes_read)
         end_time = datetime.datetime.now()
         if(result != 0):
             print_error_msg("Failed to read samples from device due to some libusb error.")
@@ -847,8 +907,67 @@ class librtlsdr:
         if num_bytes != num_bytes_read.value:
             print_warn_msg("Requested to read %d bytes. Read %d bytes from the device."%(num_bytes, num_bytes_read.value))
         
-        return (end_time - start_time).total_seconds() * 1000, np.ctypeslib.as_array(sample_bfr)        
-    
+        # np.frombuffer builds a zero-copy view directly over the
+        # ctypes buffer without the dtype/shape negotiation that
+        # np.ctypeslib.as_array performs per call.
+        return (end_time - start_time).total_seconds() * 1000, np.frombuffer(sample_bfr, dtype=np.uint8)
+
+    def py_rtlsdr_read_async(self, device_handle_ptr, callback, buf_num=0, buf_len=0):
+        """
+        Reads IQ samples from the device asynchronously.
+        This call blocks until py_rtlsdr_cancel_async is
+        called from another thread. The specified callback
+        is invoked for every buffer of samples read from
+        the device.
+
+        Parameters
+        ----------
+        * dev_handle_ptr                        : (p_rtlsdr_dev) Device handle pointer.
+        * callback                              : (rtlsdr_read_async_cb_t) Callback to invoke
+                                                    for each buffer of samples. The caller must
+                                                    keep a reference to the callback alive for
+                                                    the duration of the async read.
+        * buf_num                               : (int) Number of libusb buffers to use.
+                                                    Default: 0 (librtlsdr default).
+        * buf_len                               : (int) Length of each libusb buffer in bytes.
+                                                    Must be a multiple of 512. Default: 0
+                                                    (librtlsdr default).
+
+        Raises
+        ------
+        * ValueError
+                                                * If fails to start the async read.
+        """
+
+        self.__validate_handle(device_handle_ptr)
+
+        result = self._rtlsdr_read_async(device_handle_ptr, callback, None,
+                                              c_uint32(buf_num), c_uint32(buf_len))
+        if result != 0:
+            print_error_msg("Failed to read samples asynchronously from the device.")
+            raise ValueError
+
+    def py_rtlsdr_cancel_async(self, device_handle_ptr):
+        """
+        Cancels a pending asynchronous read started by
+        py_rtlsdr_read_async.
+
+        Parameters
+        ----------
+        * dev_handle_ptr                        : (p_rtlsdr_dev) Device handle pointer.
+
+        Raises
+        ------
+        * Warning
+                                                * If no async read is pending on the device.
+        """
+
+        self.__validate_handle(device_handle_ptr)
+
+        result = self._rtlsdr_cancel_async(device_handle_ptr)
+        if result != 0:
+            print_warn_msg("No pending asynchronous read to cancel on the device.")
+
     '''
     def py_rtlsdr_is_tuner_PLL_locked(self, device_handle_ptr):
         """
@@ -874,16 +993,10 @@ class librtlsdr:
         
         """
 
-        if not self.__apis_init_stat['py_rtlsdr_is_tuner_PLL_locked']:
-            f = self.clib.rtlsdr_is_tuner_PLL_locked
-            f.restype, f.argtypes = c_int, [p_rtlsdr_dev]
-            self.__apis_init_stat['py_rtlsdr_is_tuner_PLL_locked'] = True
-
-        self.__check_for_rtlsdr_devices()
-        
-        pll_locked = self.clib.rtlsdr_is_tuner_PLL_locked(device_handle_ptr)
-        print(pll_locked)
+        self.__validate_handle(device_handle_ptr)
         
+        pll_locked = self._rtlsdr_is_tuner_PLL_locked(device_handle_ptr)
+
         if pll_locked == 0:
             return True
         elif pll_locked == 1:
@@ -896,3 +1009,28 @@ class librtlsdr:
             raise ValueError
 
     '''
+
+"""
+Process-global librtlsdr instance shared through
+get_librtlsdr(). The rtlsdr shared library is stateless
+at the CDLL level, so a single instance can serve every
+caller in the process.
+"""
+_librtlsdr_instance = None
+
+def get_librtlsdr():
+    """
+    Returns the process-global librtlsdr instance, creating
+    it on the first call. Callers should prefer this factory
+    over instantiating librtlsdr directly, so the loaded
+    shared library and its prototyped function pointers are
+    shared instead of re-created per instance.
+
+    Returns
+    -------
+    * lib                           : (librtlsdr) The shared librtlsdr instance.
+    """
+    global _librtlsdr_instance
+    if _librtlsdr_instance is None:
+        _librtlsdr_instance = librtlsdr()
+    return _librtlsdr_instance
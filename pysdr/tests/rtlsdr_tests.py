@@ -1,10 +1,12 @@
-from pysdr.rtlsdr import *
+from pysdr.rtlsdr_apis import librtlsdr
 
 def test_librtlsdr_initialization():
 
     """
     Verifies the librtlsdr intialization.
     This test is aim to test successful loading
-    of librtlsdr.so library.
+    of librtlsdr.so library. The library is loaded
+    lazily, so accessing clib triggers the load.
     """
     obj = librtlsdr()
+    assert obj.clib is not None
@@ -1,2 +1,3 @@
 from pysdr.tests.utils_tests import *
-from pysdr.tests.rtlsdr_tests import *
\ No newline at end of file
+from pysdr.tests.rtlsdr_tests import *
+from pysdr.tests.kernels_tests import *
\ No newline at end of file
@@ -86,8 +86,9 @@ def test_c_ubyte_ptr_to_string_null_based():
 def test_cstr():
     """
     Verifies the cstr function.
-    The function should return the cstring.
+    The function should return a NUL-terminated
+    ctypes buffer holding the string bytes.
     """
     sample_string = "abcdef"
     csample_string = cstr(sample_string)
-    assert sample_string == csample_string
\ No newline at end of file
+    assert csample_string.value.decode('ascii') == sample_string
\ No newline at end of file
@@ -1,9 +1,41 @@
-from colorama import init
-from colorama import Fore, Style
-from ctypes import c_ubyte, c_void_p
+import sys
+from ctypes import c_ubyte, c_void_p, string_at, create_string_buffer
 
-# Intializes the colorama library.
-init()
+"""
+colorama exists to translate ANSI escapes for the Windows
+console; its init() wraps sys.stdout with a write interceptor
+that reparses every message. On POSIX the terminal understands
+the escapes natively, so the raw sequences are written directly
+and colorama stays out of the write path entirely.
+
+The message prefixes and the suffix are built once at
+import, so each print helper performs a single string
+concatenation and one stream write instead of rebuilding
+the style sequences on every call.
+"""
+if sys.platform == 'win32':
+    from colorama import init
+    from colorama import Fore, Style
+    init()
+    _BRIGHT = Style.BRIGHT
+    _RED = Fore.RED
+    _BLUE = Fore.BLUE
+    _GREEN = Fore.GREEN
+    _YELLOW = Fore.YELLOW
+    _RESET = Style.RESET_ALL
+else:
+    _BRIGHT = '\x1b[1m'
+    _RED = '\x1b[31m'
+    _BLUE = '\x1b[34m'
+    _GREEN = '\x1b[32m'
+    _YELLOW = '\x1b[33m'
+    _RESET = '\x1b[0m'
+
+_ERROR_PREFIX = _BRIGHT + _RED + "[x]:  "
+_INFO_PREFIX = _BRIGHT + _BLUE + "[i]:  "
+_SUCCESS_PREFIX = _BRIGHT + _GREEN + "[*]:  "
+_WARN_PREFIX = _BRIGHT + _YELLOW + "[~]:  "
+_MSG_SUFFIX = " " + _RESET + "\n"
 
 def print_error_msg(msg):
     """
@@ -15,7 +47,7 @@ def print_error_msg(msg):
     ----------
         msg: The message to print on the console.
     """
-    print(Style.BRIGHT + Fore.RED + "[x]: ", msg, Style.RESET_ALL)
+    sys.stdout.write(_ERROR_PREFIX + str(msg) + _MSG_SUFFIX)
 
 def print_info_msg(msg):
     """
@@ -27,7 +59,7 @@ def print_info_msg(msg):
     ----------
         msg: The message to print on the console.
     """
-    print(Style.BRIGHT + Fore.BLUE + "[i]: ", msg, Style.RESET_ALL)
+    sys.stdout.write(_INFO_PREFIX + str(msg) + _MSG_SUFFIX)
 
 def print_success_msg(msg):
     """
@@ -39,7 +71,7 @@ def print_success_msg(msg):
     ----------
         msg: The message to print on the console.
     """
-    print(Style.BRIGHT + Fore.GREEN + "[*]: ", msg, Style.RESET_ALL)
+    sys.stdout.write(_SUCCESS_PREFIX + str(msg) + _MSG_SUFFIX)
 
 def print_warn_msg(msg):
     """
@@ -51,7 +83,7 @@ def print_warn_msg(msg):
     ----------
         msg: The message to print on the console.
     """
-    print(Style.BRIGHT + Fore.YELLOW + "[~]: ", msg, Style.RESET_ALL)
+    sys.stdout.write(_WARN_PREFIX + str(msg) + _MSG_SUFFIX)
 
 def c_ubyte_ptr_to_string(c_ubyte_pointer, size):
     """
@@ -64,12 +96,11 @@ def c_ubyte_ptr_to_string(c_ubyte_pointer, size):
     * c_ubyte_pointer                 : Pointer to starting of the buffer.
     * size                            : Size of the buffer to read.
     """
-    buffer_str = ''
-    for idx in range(0, size):
-        if chr(c_ubyte_pointer[idx]) == '\x00':
-            break
-        buffer_str += chr(c_ubyte_pointer[idx])
-    return buffer_str
+    # string_at copies the buffer with a single C-level memcpy
+    # and the null scan runs in C, instead of one ctypes indexed
+    # read per byte in a Python loop. latin-1 maps each byte to
+    # the same character chr() produced.
+    return string_at(c_ubyte_pointer, size).split(b'\x00', 1)[0].decode('latin-1')
 
 def cstr(string):
     """
@@ -82,19 +113,17 @@ def cstr(string):
 
     Returns
     -------
-    * cstr                          : (c_ubyte array) Equivalent c-string.
+    * cstr                          : (bytes buffer) Equivalent NUL-terminated
+                                        c-string.
 
     Raises
     ------
-    * ValueError                    
+    * ValueError
                                     * If type of string is not Python String.
     """
 
     if type(string) != str:
         print_error_msg("Expected string to be a Python string. Got: %s"%(type(string)))
         raise ValueError
-    
-    array_type = c_void_p * (len(string)+1)
-    cstr = array_type()
-    cstr = string
-    return cstr
\ No newline at end of file
+
+    return create_string_buffer(string.encode('ascii'))
\ No newline at end of file